@@ -0,0 +1,155 @@
+import csv
+import gc
+import json
+import math
+import random
+import statistics
+import time
+
+DISTRIBUTIONS = ['file', 'random', 'sorted', 'nearly-sorted', 'reversed', 'duplicates']
+
+# Growth functions used to extrapolate skipped measurements
+COMPLEXITIES = {
+    'n': lambda n: n,
+    'n log n': lambda n: n * math.log2(max(n, 2)),
+    'n^2': lambda n: n * n,
+}
+
+RESULT_FIELDS = ['algorithm', 'distribution', 'size', 'status', 'loops', 'trials',
+                 'median', 'iqr', 'min']
+
+
+def user_key(user):
+    return (user['age'], user['first_name'], user['last_name'])
+
+
+def make_input(users, size, distribution, seed=0):
+    rng = random.Random(seed + size)
+    # Repeat the file if more users are requested than it holds
+    base = [users[i % len(users)] for i in range(size)]
+
+    if distribution == 'file':
+        return base
+    if distribution == 'random':
+        rng.shuffle(base)
+        return base
+    if distribution == 'sorted':
+        return sorted(base, key=user_key)
+    if distribution == 'nearly-sorted':
+        # A sorted file with a few new users appended at the end (about 5%)
+        tail = max(1, size // 20) if size > 1 else 0
+        return sorted(base[:size - tail], key=user_key) + base[size - tail:]
+    if distribution == 'reversed':
+        return sorted(base, key=user_key, reverse=True)
+    if distribution == 'duplicates':
+        # Only a handful of distinct users, each repeated many times
+        pool = base[:10]
+        return [rng.choice(pool) for _ in range(size)]
+    raise ValueError(f"Unknown input distribution: {distribution}")
+
+
+def run_trial(func, data, loops):
+    # Copies are made before the clock starts so only the sort is timed
+    copies = [list(data) for _ in range(loops)]
+    start = time.perf_counter()
+    for copy in copies:
+        func(copy)
+    return (time.perf_counter() - start) / loops
+
+
+def calibrate_loops(func, data, min_trial_time):
+    # Like timeit.autorange: repeat tiny sorts until one trial is measurable
+    loops = 1
+    while True:
+        if run_trial(func, data, loops) * loops >= min_trial_time or loops >= 1 << 20:
+            return loops
+        loops *= 2
+
+
+def time_algorithm(func, data, warmups=2, repeats=7, min_trial_time=0.001, disable_gc=True):
+    gc_was_enabled = gc.isenabled()
+    if disable_gc:
+        gc.collect()
+        gc.disable()
+    try:
+        loops = calibrate_loops(func, data, min_trial_time)
+        for _ in range(warmups):
+            run_trial(func, data, loops)
+        times = [run_trial(func, data, loops) for _ in range(repeats)]
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return loops, times
+
+
+def summarize(times):
+    if len(times) >= 2:
+        q1, _, q3 = statistics.quantiles(times, n=4)
+        iqr = q3 - q1
+    else:
+        iqr = 0.0
+    return {'median': statistics.median(times), 'iqr': iqr, 'min': min(times)}
+
+
+def extrapolate(complexity, last_size, last_time, size):
+    grow = COMPLEXITIES[complexity]
+    return last_time * grow(size) / grow(last_size)
+
+
+def run_benchmark(algorithms, users, sizes, distributions=('file',), warmups=2, repeats=7,
+                  time_budget=5.0, disable_gc=True, verbose=True):
+    # algorithms: list of (name, func, complexity) where func(data) returns the sorted list
+    results = []
+
+    for distribution in distributions:
+        for name, func, complexity in algorithms:
+            last_measured = None
+            for size in sizes:
+                data = make_input(users, size, distribution)
+
+                # Skip sizes whose predicted cost for all trials exceeds the budget
+                if last_measured is not None:
+                    predicted = extrapolate(complexity, last_measured[0], last_measured[1], size)
+                    if predicted * (warmups + repeats) > time_budget:
+                        results.append({
+                            'algorithm': name, 'distribution': distribution, 'size': size,
+                            'status': 'extrapolated', 'loops': 0, 'trials': 0,
+                            'median': predicted, 'iqr': None, 'min': None,
+                        })
+                        if verbose:
+                            print(f"  {name:<28} {distribution:<11} {size:<8} ~{predicted:.9f} s (extrapolated)")
+                        continue
+
+                loops, times = time_algorithm(func, data, warmups, repeats, disable_gc=disable_gc)
+                summary = summarize(times)
+                last_measured = (size, summary['median'])
+                results.append({
+                    'algorithm': name, 'distribution': distribution, 'size': size,
+                    'status': 'measured', 'loops': loops, 'trials': len(times),
+                    **summary,
+                })
+                if verbose:
+                    print(f"  {name:<28} {distribution:<11} {size:<8} {summary['median']:.9f} s "
+                          f"(IQR {summary['iqr']:.9f}, min {summary['min']:.9f})")
+
+    return results
+
+
+def find_result(results, algorithm, distribution, size):
+    for r in results:
+        if r['algorithm'] == algorithm and r['distribution'] == distribution and r['size'] == size:
+            return r
+    return None
+
+
+def write_json(results, filename):
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+
+
+def write_csv(results, filename, fields=RESULT_FIELDS):
+    with open(filename, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        for r in results:
+            writer.writerow({k: ('' if r[k] is None else r[k]) for k in fields})
@@ -1,6 +1,7 @@
 def bubble_sort(arr, stats=None):
+    # Choose the code path once: counting only when stats are requested
     if stats is None:
-        stats = {'comparisons': 0, 'swaps': 0, 'max_memory': 0, 'max_depth': 0}
+        return bubble_sort_fast(arr)
     
     n = len(arr)
     # Bubble sort uses O(1) auxiliary memory (in-place)
@@ -8,39 +9,50 @@ def bubble_sort(arr, stats=None):
     # Bubble sort is iterative, no recursion
     stats['max_depth'] = 0
     
+    comparisons = 0
+    swaps = 0
     for i in range(n):
         swapped = False
         for j in range(0, n - i - 1):
-            stats['comparisons'] += 1
+            comparisons += 1
             # Compare by age first, then first_name, then last_name
             if (arr[j]['age'] > arr[j + 1]['age'] or
                 (arr[j]['age'] == arr[j + 1]['age'] and arr[j]['first_name'] > arr[j + 1]['first_name']) or
                 (arr[j]['age'] == arr[j + 1]['age'] and arr[j]['first_name'] == arr[j + 1]['first_name'] and arr[j]['last_name'] > arr[j + 1]['last_name'])):
                 arr[j], arr[j + 1] = arr[j + 1], arr[j]
-                stats['swaps'] += 1
+                swaps += 1
                 swapped = True
         if not swapped:
             break
+    
+    # Write local counters back once
+    stats['comparisons'] += comparisons
+    stats['swaps'] += swaps
     return arr
 
 
-def load_users(filename):
-    users = []
-    with open(filename, 'r', encoding='utf-8-sig') as f:
-        for line in f:
-            parts = line.strip().split()
-            if len(parts) == 3:
-                users.append({
-                    'age': int(parts[0]),
-                    'first_name': parts[1],
-                    'last_name': parts[2]
-                })
-    return users
+def bubble_sort_fast(arr):
+    # Uninstrumented path: the same passes and comparisons as bubble_sort, no counters
+    n = len(arr)
+    
+    for i in range(n):
+        swapped = False
+        for j in range(0, n - i - 1):
+            # Compare by age first, then first_name, then last_name
+            if (arr[j]['age'] > arr[j + 1]['age'] or
+                (arr[j]['age'] == arr[j + 1]['age'] and arr[j]['first_name'] > arr[j + 1]['first_name']) or
+                (arr[j]['age'] == arr[j + 1]['age'] and arr[j]['first_name'] == arr[j + 1]['first_name'] and arr[j]['last_name'] > arr[j + 1]['last_name'])):
+                arr[j], arr[j + 1] = arr[j + 1], arr[j]
+                swapped = True
+        if not swapped:
+            break
+    return arr
 
 
 if __name__ == '__main__':
     import os
     import time
+    from UserLoader import load_users
     
     # Load users from file
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -1,148 +1,345 @@
-import time
+import argparse
 import matplotlib.pyplot as plt
 import os
 
-# Import both sorting algorithms
+# Import all sorting algorithms
 from MergeSort import merge_sort
 from BubbleSort import bubble_sort
+from CountingSort import radix_sort
+from NaturalMergeSort import natural_merge_sort
+from UserLoader import load_users
+from PrefixSort import sorted_prefixes, format_users
+from MemoryProfile import MEMORY_FIELDS, profile_in_subprocess
+from BenchmarkHarness import DISTRIBUTIONS, make_input, run_benchmark, find_result, write_json, write_csv
 
+# NumPy is optional: without it the lexsort backend is simply left out
+try:
+    from NumpySort import numpy_sort
+except ImportError:
+    numpy_sort = None
 
-def load_users(filename):
-    users = []
-    with open(filename, 'r', encoding='utf-8-sig') as f:
-        for line in f:
-            parts = line.strip().split()
-            if len(parts) == 3:
-                users.append({
-                    'age': int(parts[0]),
-                    'first_name': parts[1],
-                    'last_name': parts[2]
-                })
-    return users
-
-
-
-def benchmark_sorting(users_data):
-    # Diverse test sizes from 5 to 5000
-    test_sizes = [5, 10, 25, 50, 100, 250, 500, 750, 1000, 1500, 2000, 3000, 4000, 5000]
-    
-    merge_times = []
-    bubble_times = []
-    merge_stats_list = []
-    bubble_stats_list = []
-    
-    print("Performance Comparison: Merge Sort vs Bubble Sort")
+# Diverse test sizes from 5 to 5000
+TEST_SIZES = [5, 10, 25, 50, 100, 250, 500, 750, 1000, 1500, 2000, 3000, 4000, 5000]
+
+# Every contender: 'moves' names the stats counter for element moves,
+# algorithms without instrumentation have moves=None
+ALGORITHMS = [
+    {'name': 'Merge Sort', 'func': merge_sort, 'moves': 'writes', 'complexity': 'n log n',
+     'label': 'Merge Sort O(n log n)', 'color': 'blue', 'marker': 'o'},
+    {'name': 'Bubble Sort', 'func': bubble_sort, 'moves': 'swaps', 'complexity': 'n^2',
+     'label': 'Bubble Sort O(n²)', 'color': 'red', 'marker': 's'},
+    {'name': 'Radix Sort', 'func': radix_sort, 'moves': 'writes', 'complexity': 'n',
+     'label': 'Radix Sort O(n + k)', 'color': 'green', 'marker': '^'},
+    {'name': 'Natural Merge', 'func': natural_merge_sort, 'moves': 'writes', 'complexity': 'n log n',
+     'label': 'Natural Merge Sort O(n log n), O(n) on runs', 'color': 'orange', 'marker': 'v'},
+]
+
+if numpy_sort is not None:
+    ALGORITHMS.append({'name': 'NumPy lexsort', 'func': numpy_sort, 'moves': None, 'complexity': 'n log n',
+                       'label': 'NumPy lexsort', 'color': 'purple', 'marker': 'D'})
+
+
+# Input orders and sizes for the comparison-count table
+COUNT_DISTRIBUTIONS = ['sorted', 'nearly-sorted', 'random']
+COUNT_SIZES = [100, 1000, 5000]
+
+
+def new_stats(algo):
+    return {'comparisons': 0, algo['moves']: 0, 'max_memory': 0, 'max_depth': 0}
+
+
+def instrumented_name(algo):
+    return f"{algo['name']} (instrumented)"
+
+
+def instrumented(algo):
+    # Same algorithm with a fresh stats dict, so counters are switched on
+    def run(data):
+        return algo['func'](data, new_stats(algo))
+    return run
+
+
+def timed_algorithms():
+    # Uninstrumented runs give real algorithm speed, instrumented runs the counting overhead
+    timed = [(a['name'], a['func'], a['complexity']) for a in ALGORITHMS]
+    timed += [(instrumented_name(a), instrumented(a), a['complexity'])
+              for a in ALGORITHMS if a['moves'] is not None]
+    return timed
+
+
+def count_comparisons(users_data, distributions=COUNT_DISTRIBUTIONS, sizes=COUNT_SIZES):
+    # Exact comparison counts of every instrumented algorithm per input order
+    counts = {}
+    for distribution in distributions:
+        for size in sizes:
+            data = make_input(users_data, size, distribution)
+            for algo in ALGORITHMS:
+                if algo['moves'] is None:
+                    continue
+                stats = new_stats(algo)
+                algo['func'](list(data), stats)
+                counts[(algo['name'], distribution, size)] = stats['comparisons']
+    return counts
+
+
+def profile_memory(results, users_file):
+    # Every algorithm/size in its own interpreter; sizes skipped by the time budget stay skipped
+    memory = []
+    print("\nMemory profiling (one subprocess per algorithm and size)")
+    for algo in ALGORITHMS:
+        for size in TEST_SIZES:
+            if find_result(results, algo['name'], 'file', size)['status'] == 'extrapolated':
+                continue
+            result = profile_in_subprocess(algo['name'], algo['func'], size, users_file)
+            memory.append(result)
+            print(f"  {algo['name']:<15} {size:<8} tracemalloc peak {result['tracemalloc_peak']:>12,} B, "
+                  f"peak RSS {result['peak_rss']:>14,} B")
+    return memory
+
+
+def find_memory(memory, algorithm, size):
+    for m in memory:
+        if m['algorithm'] == algorithm and m['size'] == size:
+            return m
+    return None
+
+
+def format_time(result):
+    # Extrapolated timings are marked with '~'
+    prefix = '~' if result['status'] == 'extrapolated' else ''
+    return f"{prefix}{result['median']:.9f}"
+
+
+def benchmark_sorting(users_data, distributions=('file',), warmups=2, repeats=7, time_budget=5.0):
+    # Timings: warm-up runs, repeated trials, GC disabled, budgeted per algorithm.
+    # The file order is always timed first, the tables and output files below use it
+    distributions = ['file'] + [d for d in distributions if d != 'file']
+    print("Timing algorithms (median of repeated trials)\n")
+    results = run_benchmark(timed_algorithms(), users_data, TEST_SIZES, distributions,
+                            warmups=warmups, repeats=repeats, time_budget=time_budget)
+
+    stats_lists = {a['name']: [] for a in ALGORITHMS}
+
+    print("\nPerformance Comparison: " + " vs ".join(a['name'] for a in ALGORITHMS))
     print(f"Testing with first N users from users.txt\n")
-    print(f"{'Users':<10} {'Merge Sort (s)':<20} {'Bubble Sort (s)':<20} {'Speedup':<10}")
-    print("-" * 70)
-    
+    print(f"{'Users':<10} " + " ".join(f"{a['name'] + ' (s)':<20}" for a in ALGORITHMS))
+    print("-" * (11 + 21 * len(ALGORITHMS)))
+
     script_dir = os.path.dirname(os.path.abspath(__file__))
-    
-    for size in test_sizes:
+
+    # Sorted order of every prefix from one incremental pass over the file
+    prefixes = sorted_prefixes(users_data, TEST_SIZES)
+
+    for size in TEST_SIZES:
         # Use first N users from actual data
         test_data = users_data[:size]
-        
-        # Test Merge Sort with statistics
-        data_copy = [u.copy() for u in test_data]
-        merge_stats = {'comparisons': 0, 'writes': 0, 'max_memory': 0, 'max_depth': 0}
-        start = time.perf_counter()
-        sorted_merge = merge_sort(data_copy, merge_stats)
-        merge_time = time.perf_counter() - start
-        merge_times.append(merge_time)
-        merge_stats_list.append(merge_stats)
-        
-        # Test Bubble Sort with statistics
-        data_copy = [u.copy() for u in test_data]
-        bubble_stats = {'comparisons': 0, 'swaps': 0, 'max_memory': 0, 'max_depth': 0}
-        start = time.perf_counter()
-        sorted_bubble = bubble_sort(data_copy, bubble_stats)
-        bubble_time = time.perf_counter() - start
-        bubble_times.append(bubble_time)
-        bubble_stats_list.append(bubble_stats)
-        
-        # Write output file for this range
+        sorted_reference = prefixes[size]
+
+        # One instrumented run per algorithm for exact operation counts,
+        # skipped where the timing budget already skipped the algorithm
+        for algo in ALGORITHMS:
+            if find_result(results, algo['name'], 'file', size)['status'] == 'extrapolated':
+                stats_lists[algo['name']].append(None)
+                continue
+
+            if algo['moves'] is None:
+                stats = None
+                sorted_data = algo['func'](list(test_data))
+            else:
+                stats = new_stats(algo)
+                sorted_data = algo['func'](list(test_data), stats)
+            stats_lists[algo['name']].append(stats)
+
+            # Every algorithm must produce exactly the same order
+            if sorted_data != sorted_reference:
+                raise AssertionError(f"{algo['name']} output differs from the sorted prefix for {size} users")
+
+        # Build the output file for this range in memory, then write it in one go
+        lines = [f"First {size} users - Sorted by Age → First Name → Last Name\n"]
+        for algo in ALGORITHMS:
+            result = find_result(results, algo['name'], 'file', size)
+            stats = stats_lists[algo['name']][-1]
+            lines.append(f"\n=== {algo['name'].upper()} STATISTICS ===\n")
+            lines.append(f"Time: {format_time(result)} seconds\n")
+            if result['status'] == 'extrapolated':
+                lines.append("Skipped: over time budget, time extrapolated\n")
+                continue
+            lines.append(f"Time IQR: {result['iqr']:.9f} seconds\n")
+            lines.append(f"Time Min: {result['min']:.9f} seconds\n")
+            if stats is None:
+                continue
+            instr_result = find_result(results, instrumented_name(algo), 'file', size)
+            lines.append(f"Instrumented Time: {format_time(instr_result)} seconds\n")
+            lines.append(f"Comparisons: {stats['comparisons']:,}\n")
+            lines.append(f"{algo['moves'].capitalize()}: {stats[algo['moves']]:,}\n")
+            lines.append(f"Auxiliary Memory (max elements): {stats['max_memory']:,}\n")
+            lines.append(f"Recursion Depth: {stats['max_depth']:,}\n")
+
+        lines.append(f"\n=== SORTED DATA ===\n")
+        lines.append(format_users(sorted_reference))
+
         output_file = os.path.join(script_dir, f'output{size}.txt')
         with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(f"First {size} users - Sorted by Age → First Name → Last Name\n")
-            f.write(f"\n=== MERGE SORT STATISTICS ===\n")
-            f.write(f"Time: {merge_time:.9f} seconds\n")
-            f.write(f"Comparisons: {merge_stats['comparisons']:,}\n")
-            f.write(f"Writes: {merge_stats['writes']:,}\n")
-            f.write(f"Auxiliary Memory (max elements): {merge_stats['max_memory']:,}\n")
-            f.write(f"Recursion Depth: {merge_stats['max_depth']:,}\n")
-            
-            f.write(f"\n=== BUBBLE SORT STATISTICS ===\n")
-            f.write(f"Time: {bubble_time:.9f} seconds\n")
-            f.write(f"Comparisons: {bubble_stats['comparisons']:,}\n")
-            f.write(f"Swaps: {bubble_stats['swaps']:,}\n")
-            f.write(f"Auxiliary Memory (max elements): {bubble_stats['max_memory']:,}\n")
-            f.write(f"Recursion Depth: {bubble_stats['max_depth']:,}\n")
-            
-            f.write(f"\n=== SORTED DATA ===\n")
-            for user in sorted_merge:
-                f.write(f"  Age: {user['age']:3}, First Name: {user['first_name']:10}, Last Name: {user['last_name']:10}\n")
-        
-        speedup = bubble_time / merge_time if merge_time > 0 else 1
-        print(f"{size:<10} {merge_time:<20.9f} {bubble_time:<20.9f} {speedup:<10.2f}x")
-    
-    return test_sizes, merge_times, bubble_times, merge_stats_list, bubble_stats_list
+            f.write(''.join(lines))
+
+        print(f"{size:<10} " + " ".join(
+            f"{format_time(find_result(results, a['name'], 'file', size)):<20}" for a in ALGORITHMS))
+
+    return TEST_SIZES, results, stats_lists
 
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compare sorting algorithms on users.txt')
+    parser.add_argument('--distributions', nargs='+', default=DISTRIBUTIONS, choices=DISTRIBUTIONS,
+                        help='input orders to time (output files always use file order)')
+    parser.add_argument('--warmups', type=int, default=2)
+    parser.add_argument('--repeats', type=int, default=7)
+    parser.add_argument('--memory', action='store_true',
+                        help='also measure tracemalloc and peak RSS per algorithm/size in subprocesses')
+    parser.add_argument('--time-budget', type=float, default=5.0,
+                        help='seconds one algorithm may spend per size before it is extrapolated')
+    args = parser.parse_args()
+
     # Load users from users.txt
     script_dir = os.path.dirname(os.path.abspath(__file__))
     users_file = os.path.join(script_dir, 'users.txt')
     all_users = load_users(users_file)
-    
+
     print(f"Loaded {len(all_users)} users from users.txt\n")
-    
+
     # Run benchmarks
-    sizes, merge_times, bubble_times, merge_stats_list, bubble_stats_list = benchmark_sorting(all_users)
-    
+    sizes, results, stats_lists = benchmark_sorting(all_users, args.distributions, args.warmups,
+                                                    args.repeats, args.time_budget)
+
     print(f"\nGenerated {len(sizes)} output files (output5.txt through output5000.txt)")
-    
+
+    memory = profile_memory(results, users_file) if args.memory else []
+
     # Create statistics summary file
     stats_file = os.path.join(script_dir, 'statistics_summary.txt')
     with open(stats_file, 'w', encoding='utf-8') as f:
         f.write("SORTING ALGORITHM STATISTICS COMPARISON\n")
-        f.write("=" * 120 + "\n\n")
-        
-        f.write(f"{'Size':<10} {'Algorithm':<15} {'Time (s)':<15} {'Comparisons':<20} {'Swaps/Writes':<20} {'Aux Memory':<15} {'Recursion':<12}\n")
-        f.write("-" * 120 + "\n")
-        
+        f.write("=" * 170 + "\n\n")
+        f.write(f"Times are medians of {args.repeats} trials after {args.warmups} warm-up runs with GC disabled; "
+                f"'~' marks times extrapolated after exceeding the {args.time_budget:g}s budget\n")
+        f.write("Time is the uninstrumented algorithm, Instr. Time the same algorithm with operation counters on\n\n")
+
+        f.write(f"{'Size':<10} {'Algorithm':<15} {'Time (s)':<15} {'IQR (s)':<15} {'Min (s)':<15} {'Instr. Time (s)':<16} {'Comparisons':<20} {'Swaps/Writes':<20} {'Aux Memory':<15} {'Recursion':<12}\n")
+        f.write("-" * 170 + "\n")
+
         for i, size in enumerate(sizes):
-            f.write(f"{size:<10} Merge Sort      {merge_times[i]:<15.9f} {merge_stats_list[i]['comparisons']:<20,} {merge_stats_list[i]['writes']:<20,} {merge_stats_list[i]['max_memory']:<15,} {merge_stats_list[i]['max_depth']:<12,}\n")
-            f.write(f"{'':<10} Bubble Sort     {bubble_times[i]:<15.9f} {bubble_stats_list[i]['comparisons']:<20,} {bubble_stats_list[i]['swaps']:<20,} {bubble_stats_list[i]['max_memory']:<15,} {bubble_stats_list[i]['max_depth']:<12,}\n")
+            for j, algo in enumerate(ALGORITHMS):
+                result = find_result(results, algo['name'], 'file', size)
+                stats = stats_lists[algo['name']][i]
+                iqr = f"{result['iqr']:.9f}" if result['iqr'] is not None else '-'
+                best = f"{result['min']:.9f}" if result['min'] is not None else '-'
+                if stats is None:
+                    counts = f"{'-':<16} {'-':<20} {'-':<20} {'-':<15} {'-':<12}"
+                else:
+                    instr_result = find_result(results, instrumented_name(algo), 'file', size)
+                    counts = f"{format_time(instr_result):<16} {stats['comparisons']:<20,} {stats[algo['moves']]:<20,} {stats['max_memory']:<15,} {stats['max_depth']:<12,}"
+                label = size if j == 0 else ''
+                f.write(f"{label:<10} {algo['name']:<15} {format_time(result):<15} {iqr:<15} {best:<15} {counts}\n")
+            f.write("\n")
+
+        # Comparison counts show which algorithms adapt to existing order
+        counted = [a for a in ALGORITHMS if a['moves'] is not None]
+        f.write("\nCOMPARISONS BY INPUT ORDER\n")
+        f.write("=" * 170 + "\n\n")
+        f.write(f"{'Order':<15} {'Size':<10} " + " ".join(f"{a['name']:<20}" for a in counted) + "\n")
+        f.write("-" * 170 + "\n")
+        counts = count_comparisons(all_users)
+        for distribution in COUNT_DISTRIBUTIONS:
+            for size in COUNT_SIZES:
+                f.write(f"{distribution:<15} {size:<10} " +
+                        " ".join(f"{counts[(a['name'], distribution, size)]:<20,}" for a in counted) + "\n")
             f.write("\n")
-    
+
+        if memory:
+            # Bytes really allocated, next to the max_memory element estimate above
+            f.write("\nMEMORY PROFILE (bytes, one subprocess per run)\n")
+            f.write("=" * 170 + "\n")
+            f.write("Measured on the uninstrumented path timed in the Time column; Aux Memory above counts elements on the instrumented path\n")
+            f.write("Tracemalloc Peak/Current: Python allocations during the sort, at their highest and still held after it\n")
+            f.write("Scope 'sort': Baseline RSS is the resident memory just before the sort, Peak RSS the highest resident memory during the sort\n")
+            f.write("Scope 'process': the peak could not be reset, Baseline RSS and Peak RSS are highs since process start (loading included)\n\n")
+            f.write(f"{'Size':<10} {'Algorithm':<15} {'Tracemalloc Peak':<20} {'Tracemalloc Current':<20} {'Baseline RSS':<20} {'Peak RSS':<20} {'Scope':<10}\n")
+            f.write("-" * 170 + "\n")
+            for size in sizes:
+                rows = [(algo, find_memory(memory, algo['name'], size)) for algo in ALGORITHMS]
+                for j, (algo, m) in enumerate(r for r in rows if r[1] is not None):
+                    label = size if j == 0 else ''
+                    f.write(f"{label:<10} {algo['name']:<15} {m['tracemalloc_peak']:<20,} {m['tracemalloc_current']:<20,} {m['baseline_rss']:<20,} {m['peak_rss']:<20,} {m['peak_scope']:<10}\n")
+                f.write("\n")
+
     print(f"Generated: statistics_summary.txt")
-    
+
+    # Machine-readable results for every distribution
+    write_json(results, os.path.join(script_dir, 'benchmark_results.json'))
+    write_csv(results, os.path.join(script_dir, 'benchmark_results.csv'))
+    print(f"Generated: benchmark_results.json, benchmark_results.csv")
+    if memory:
+        write_json(memory, os.path.join(script_dir, 'memory_results.json'))
+        write_csv(memory, os.path.join(script_dir, 'memory_results.csv'), MEMORY_FIELDS)
+        print(f"Generated: memory_results.json, memory_results.csv")
+
     # Single Linear Chart: Time Complexity Comparison
     plt.figure(figsize=(14, 8))
-    plt.plot(sizes, merge_times, marker='o', linewidth=2.5, markersize=8, 
-             color='blue', label='Merge Sort O(n log n)', linestyle='-')
-    plt.plot(sizes, bubble_times, marker='s', linewidth=2.5, markersize=8, 
-             color='red', label='Bubble Sort O(n²)', linestyle='-')
+    for algo in ALGORITHMS:
+        algo_results = [find_result(results, algo['name'], 'file', size) for size in sizes]
+        measured = [r for r in algo_results if r['status'] == 'measured']
+        plt.plot([r['size'] for r in measured], [r['median'] for r in measured],
+                 marker=algo['marker'], linewidth=2.5, markersize=8,
+                 color=algo['color'], label=algo['label'], linestyle='-')
+        # Extrapolated sizes continue the line dashed, from the last measured point
+        extrapolated = measured[-1:] + [r for r in algo_results if r['status'] == 'extrapolated']
+        if len(extrapolated) > 1:
+            plt.plot([r['size'] for r in extrapolated], [r['median'] for r in extrapolated],
+                     marker=algo['marker'], linewidth=1.5, markersize=8, fillstyle='none',
+                     color=algo['color'], label=f"{algo['name']} (extrapolated)", linestyle='--')
+
+        # Annotate the largest size
+        last = algo_results[-1]
+        plt.annotate(f"{'~' if last['status'] == 'extrapolated' else ''}{last['median']:.3f}s",
+                     xy=(last['size'], last['median']),
+                     xytext=(10, 0), textcoords='offset points',
+                     fontsize=9, color=algo['color'], fontweight='bold')
     plt.xlabel('Number of Users', fontsize=12)
-    plt.ylabel('Time (seconds)', fontsize=12)
+    plt.ylabel('Time (seconds, median)', fontsize=12)
     plt.title('Sorting Algorithm Time Complexity Comparison', fontsize=14, fontweight='bold')
     plt.legend(fontsize=11)
     plt.grid(True, alpha=0.3)
-    
-    # Add annotations for key points
-    max_bubble_idx = len(bubble_times) - 1
-    plt.annotate(f'{bubble_times[max_bubble_idx]:.3f}s', 
-                xy=(sizes[max_bubble_idx], bubble_times[max_bubble_idx]),
-                xytext=(10, 10), textcoords='offset points',
-                fontsize=9, color='red', fontweight='bold')
-    plt.annotate(f'{merge_times[max_bubble_idx]:.3f}s', 
-                xy=(sizes[max_bubble_idx], merge_times[max_bubble_idx]),
-                xytext=(10, -15), textcoords='offset points',
-                fontsize=9, color='blue', fontweight='bold')
-    
+
     plt.tight_layout()
     plt.savefig(os.path.join(script_dir, 'time_complexity_comparison.png'), dpi=300, bbox_inches='tight')
     plt.close()
-    
+
     print("\nExported: time_complexity_comparison.png")
+
+    if memory:
+        # Memory chart next to the time chart: traced allocations and RSS growth
+        fig, (ax_traced, ax_rss) = plt.subplots(1, 2, figsize=(18, 8))
+        for algo in ALGORITHMS:
+            algo_memory = [m for m in memory if m['algorithm'] == algo['name']]
+            run_sizes = [m['size'] for m in algo_memory]
+            ax_traced.plot(run_sizes, [m['tracemalloc_peak'] / 1024 for m in algo_memory],
+                           marker=algo['marker'], linewidth=2.5, markersize=8,
+                           color=algo['color'], label=algo['label'], linestyle='-')
+            ax_rss.plot(run_sizes, [(m['peak_rss'] - m['baseline_rss']) / 1024 for m in algo_memory],
+                        marker=algo['marker'], linewidth=2.5, markersize=8,
+                        color=algo['color'], label=algo['label'], linestyle='-')
+        ax_traced.set_title('Tracemalloc Peak During Sort', fontsize=14, fontweight='bold')
+        ax_traced.set_ylabel('Allocated (KiB)', fontsize=12)
+        ax_rss.set_title('Peak RSS Growth During Sort', fontsize=14, fontweight='bold')
+        ax_rss.set_ylabel('Peak RSS - baseline (KiB)', fontsize=12)
+        for ax in (ax_traced, ax_rss):
+            ax.set_xlabel('Number of Users', fontsize=12)
+            ax.legend(fontsize=10)
+            ax.grid(True, alpha=0.3)
+
+        plt.tight_layout()
+        plt.savefig(os.path.join(script_dir, 'memory_usage_comparison.png'), dpi=300, bbox_inches='tight')
+        plt.close()
+
+        print("Exported: memory_usage_comparison.png")
     print("\nComparison complete!")
@@ -0,0 +1,103 @@
+from functools import cmp_to_key
+
+
+def counting_pass(arr, keys, key_range, stats):
+    # Count how many elements fall into each key bucket
+    counts = [0] * (key_range + 1)
+    for k in keys:
+        counts[k + 1] += 1
+
+    # Prefix sums give the starting position of each bucket
+    for b in range(key_range):
+        counts[b + 1] += counts[b]
+
+    # Place elements in original order so the pass is stable
+    result = [None] * len(arr)
+    for idx in range(len(arr)):
+        k = keys[idx]
+        result[counts[k]] = arr[idx]
+        counts[k] += 1
+
+    # Every element is written once per pass, counted without per-element updates
+    if stats is not None:
+        stats['writes'] += len(result)
+        # Track memory for count array and output array
+        stats['max_memory'] = max(stats['max_memory'], len(result) + key_range + 1)
+
+    return result
+
+
+def sorted_names(names, stats):
+    # Sort the name dictionary; with stats, count its string comparisons
+    # since they are the only comparisons radix sort makes
+    if stats is None:
+        return sorted(names)
+
+    comparisons = 0
+
+    def compare(a, b):
+        nonlocal comparisons
+        comparisons += 1
+        return (a > b) - (a < b)
+
+    result = sorted(names, key=cmp_to_key(compare))
+    stats['comparisons'] += comparisons
+    return result
+
+
+def radix_sort(arr, stats=None):
+    if stats is not None:
+        # Radix sort is iterative, no recursion
+        stats['max_depth'] = 0
+
+    if len(arr) <= 1:
+        return list(arr)
+
+    # Encode names as rank codes from a pre-sorted name dictionary; names are
+    # collected in first-occurrence order so comparison counts do not depend on set hashing
+    first_names = sorted_names(list(dict.fromkeys(u['first_name'] for u in arr)), stats)
+    last_names = sorted_names(list(dict.fromkeys(u['last_name'] for u in arr)), stats)
+    first_rank = {name: r for r, name in enumerate(first_names)}
+    last_rank = {name: r for r, name in enumerate(last_names)}
+
+    min_age = min(u['age'] for u in arr)
+    max_age = max(u['age'] for u in arr)
+
+    # LSD order: least significant key first, age (primary key) last
+    result = list(arr)
+    result = counting_pass(result, [last_rank[u['last_name']] for u in result],
+                           len(last_names), stats)
+    result = counting_pass(result, [first_rank[u['first_name']] for u in result],
+                           len(first_names), stats)
+    result = counting_pass(result, [u['age'] - min_age for u in result],
+                           max_age - min_age + 1, stats)
+
+    return result
+
+
+if __name__ == '__main__':
+    import os
+    import time
+    from UserLoader import load_users
+
+    # Load users from file
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    users_file = os.path.join(script_dir, 'users.txt')
+    output_file = os.path.join(script_dir, 'output_radix.txt')
+    users = load_users(users_file)
+
+    # Sort users and measure time
+    start_time = time.time()
+    sorted_users = radix_sort(users)
+    sort_time = time.time() - start_time
+
+    # Write to output file
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(f"Sorted by Age → First Name → Last Name:\n")
+        for user in sorted_users:
+            f.write(f"  Age: {user['age']:3}, First Name: {user['first_name']:10}, Last Name: {user['last_name']:10}\n")
+
+        f.write(f"\nSort completed in {sort_time:.6f} seconds\n")
+
+    print(f"Output written to output_radix.txt")
+    print(f"Sorted {len(users)} users in {sort_time:.6f} seconds")
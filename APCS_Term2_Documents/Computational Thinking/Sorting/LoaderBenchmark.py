@@ -0,0 +1,82 @@
+import os
+import random
+import sys
+import tempfile
+import time
+
+from UserLoader import load_users, load_user_columns, load_users_linewise, CACHE_SUFFIX
+
+
+def write_users_file(filename, size, source_users):
+    # Repeat real users from users.txt with shuffled ages up to the wanted size
+    rng = random.Random(size)
+    with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        lines = []
+        for i in range(size):
+            user = source_users[i % len(source_users)]
+            lines.append(f"{rng.randint(18, 65)} {user['first_name']} {user['last_name']}\n")
+            if len(lines) >= 100000:
+                f.write(''.join(lines))
+                lines = []
+        f.write(''.join(lines))
+
+
+def time_call(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def time_checked(expected, func, *args):
+    # Compare with the baseline and drop the result before the next loader runs,
+    # several full user lists at 10^7 lines would not fit in memory together
+    elapsed, users = time_call(func, *args)
+    if users != expected:
+        raise AssertionError(f"{func.__name__} disagrees with the line-by-line loader")
+    return elapsed
+
+
+def benchmark_loading(test_sizes, source_users):
+    results = []
+
+    print("Load Time Comparison: line-by-line vs bulk parse vs binary cache\n")
+    print(f"{'Lines':<12} {'Line-by-line (s)':<20} {'Bulk parse (s)':<20} {'First load (s)':<20} {'Cached (s)':<20} {'Cached cols (s)':<20} {'Speedup':<10}")
+    print("-" * 125)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size in test_sizes:
+            users_file = os.path.join(tmp_dir, f'users{size}.txt')
+            write_users_file(users_file, size, source_users)
+
+            linewise_time, expected = time_call(load_users_linewise, users_file)
+
+            # Bulk parse alone, no cache involved
+            parse_time = time_checked(expected, load_users, users_file, False)
+            # First cached load also hashes the file and writes the cache
+            bulk_time = time_checked(expected, load_users, users_file)
+            # Second load is served from the cache
+            cached_time = time_checked(expected, load_users, users_file)
+            del expected
+            # Columns only, without building one dict per user
+            columns_time = time_call(load_user_columns, users_file)[0]
+
+            speedup = linewise_time / cached_time if cached_time > 0 else 1
+            print(f"{size:<12,} {linewise_time:<20.6f} {parse_time:<20.6f} {bulk_time:<20.6f} {cached_time:<20.6f} {columns_time:<20.6f} {speedup:<10.2f}x")
+            results.append((size, linewise_time, parse_time, bulk_time, cached_time, columns_time))
+
+            os.remove(users_file)
+            os.remove(users_file + CACHE_SUFFIX)
+
+    return results
+
+
+if __name__ == '__main__':
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    users_file = os.path.join(script_dir, 'users.txt')
+    source_users = load_users_linewise(users_file)
+
+    # Sizes from 10^4 to 10^7 lines, pass a smaller maximum as first argument
+    max_size = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 7
+    test_sizes = [n for n in (10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7) if n <= max_size]
+
+    benchmark_loading(test_sizes, source_users)
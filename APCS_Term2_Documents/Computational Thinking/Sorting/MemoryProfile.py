@@ -0,0 +1,129 @@
+import gc
+import importlib
+import json
+import os
+import subprocess
+import sys
+import tracemalloc
+
+MEMORY_FIELDS = ['algorithm', 'size', 'tracemalloc_peak', 'tracemalloc_current',
+                 'baseline_rss', 'peak_rss', 'peak_scope']
+
+
+def windows_memory_counters():
+    # Windows has no resource module or /proc, ask psapi for the working set
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [('cb', wintypes.DWORD), ('PageFaultCount', wintypes.DWORD),
+                    ('PeakWorkingSetSize', ctypes.c_size_t), ('WorkingSetSize', ctypes.c_size_t),
+                    ('QuotaPeakPagedPoolUsage', ctypes.c_size_t), ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                    ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t), ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                    ('PagefileUsage', ctypes.c_size_t), ('PeakPagefileUsage', ctypes.c_size_t)]
+
+    counters = PROCESS_MEMORY_COUNTERS()
+    counters.cb = ctypes.sizeof(counters)
+    handle = ctypes.windll.kernel32.GetCurrentProcess()
+    ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb)
+    return counters
+
+
+def proc_status(field):
+    # A memory field of /proc/self/status in bytes, None where there is no /proc
+    try:
+        with open('/proc/self/status', encoding='ascii') as f:
+            for line in f:
+                if line.startswith(field + ':'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def current_rss():
+    # Resident set size of this process right now in bytes, None if unknown
+    if sys.platform == 'win32':
+        return windows_memory_counters().WorkingSetSize
+    return proc_status('VmRSS')
+
+
+def reset_peak_rss():
+    # Linux only: writing 5 to clear_refs resets VmHWM to the current RSS
+    try:
+        with open('/proc/self/clear_refs', 'w', encoding='ascii') as f:
+            f.write('5')
+    except OSError:
+        return False
+    return True
+
+
+def peak_rss():
+    # Peak resident set size of this process in bytes
+    if sys.platform == 'win32':
+        return windows_memory_counters().PeakWorkingSetSize
+
+    # On Linux ru_maxrss survives exec from the parent process, VmHWM belongs to this process only
+    hwm = proc_status('VmHWM')
+    if hwm is not None:
+        return hwm
+
+    import resource
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return rss if sys.platform == 'darwin' else rss * 1024
+
+
+def profile_sort(mode, module_name, func_name, size, users_file):
+    from BenchmarkHarness import make_input
+    from UserLoader import load_users
+
+    func = getattr(importlib.import_module(module_name), func_name)
+    data_copy = list(make_input(load_users(users_file), size, 'file'))
+    gc.collect()
+
+    if mode == 'rss':
+        # Peak RSS without tracemalloc's own bookkeeping
+        baseline = current_rss()
+        if baseline is not None and reset_peak_rss():
+            # Baseline is the RSS just before the sort, peak the highest RSS during the sort
+            scope = 'sort'
+        else:
+            # The high-water mark cannot be reset (ru_maxrss, Windows peak working set):
+            # baseline and peak are both highs since process start, loading included
+            baseline = peak_rss()
+            scope = 'process'
+        func(data_copy)
+        return {'baseline_rss': baseline, 'peak_rss': peak_rss(), 'peak_scope': scope}
+
+    # Bytes allocated by the sort itself (slices, result lists, key tuples)
+    tracemalloc.start()
+    result = func(data_copy)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return {'tracemalloc_peak': peak, 'tracemalloc_current': current}
+
+
+def run_worker(mode, func, size, users_file):
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    completed = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), mode, func.__module__, func.__name__, str(size), users_file],
+        cwd=script_dir, capture_output=True, text=True, check=True)
+    return json.loads(completed.stdout)
+
+
+def profile_in_subprocess(name, func, size, users_file):
+    # A fresh interpreter per measurement: earlier runs cannot raise the RSS
+    # high-water mark or leave freed memory on free lists for the traced run
+    result = {'algorithm': name, 'size': size}
+    result.update(run_worker('trace', func, size, users_file))
+    result.update(run_worker('rss', func, size, users_file))
+    return result
+
+
+if __name__ == '__main__':
+    # Worker: MemoryProfile.py <trace|rss> <module> <function> <size> <users file>
+    mode, module_name, func_name, size, users_file = sys.argv[1:6]
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    print(json.dumps(profile_sort(mode, module_name, func_name, int(size), users_file)))
@@ -1,6 +1,7 @@
 def merge_sort(arr, stats=None, depth=0):
+    # Choose the code path once: counting only when stats are requested
     if stats is None:
-        stats = {'comparisons': 0, 'writes': 0, 'max_memory': 0, 'max_depth': 0}
+        return merge_sort_fast(arr)
     
     # Track maximum recursion depth
     stats['max_depth'] = max(stats['max_depth'], depth)
@@ -21,31 +22,27 @@ def merge_sort(arr, stats=None, depth=0):
 def merge(left, right, stats):
     result = []
     i = j = 0
+    comparisons = 0
 
     while i < len(left) and j < len(right):
-        stats['comparisons'] += 1
+        comparisons += 1
         # Compare by age first, then first_name, then last_name
         if (left[i]['age'] < right[j]['age'] or
             (left[i]['age'] == right[j]['age'] and left[i]['first_name'] < right[j]['first_name']) or
             (left[i]['age'] == right[j]['age'] and left[i]['first_name'] == right[j]['first_name'] and left[i]['last_name'] <= right[j]['last_name'])):
             result.append(left[i])
-            stats['writes'] += 1
             i += 1
         else:
             result.append(right[j])
-            stats['writes'] += 1
             j += 1
 
     # Copy remaining elements
-    while i < len(left):
-        result.append(left[i])
-        stats['writes'] += 1
-        i += 1
+    result.extend(left[i:])
+    result.extend(right[j:])
     
-    while j < len(right):
-        result.append(right[j])
-        stats['writes'] += 1
-        j += 1
+    # Write local counters back once: every element is written exactly once
+    stats['comparisons'] += comparisons
+    stats['writes'] += len(result)
     
     # Track memory for result array
     stats['max_memory'] = max(stats['max_memory'], len(result))
@@ -53,24 +50,39 @@ def merge(left, right, stats):
     return result
 
 
-def load_users(filename):
-    users = []
-    with open(filename, 'r', encoding='utf-8-sig') as f:
-        for line in f:
-            parts = line.strip().split()
-            if len(parts) == 3:
-                users.append({
-                    'age': int(parts[0]),
-                    'first_name': parts[1],
-                    'last_name': parts[2]
-                })
-    return users
+def merge_sort_fast(arr):
+    # Uninstrumented path: the same splits and comparisons as merge_sort, no counters
+    if len(arr) <= 1:
+        return arr
+
+    mid = len(arr) // 2
+    left = merge_sort_fast(arr[:mid])
+    right = merge_sort_fast(arr[mid:])
+
+    result = []
+    i = j = 0
+
+    while i < len(left) and j < len(right):
+        # Compare by age first, then first_name, then last_name
+        if (left[i]['age'] < right[j]['age'] or
+            (left[i]['age'] == right[j]['age'] and left[i]['first_name'] < right[j]['first_name']) or
+            (left[i]['age'] == right[j]['age'] and left[i]['first_name'] == right[j]['first_name'] and left[i]['last_name'] <= right[j]['last_name'])):
+            result.append(left[i])
+            i += 1
+        else:
+            result.append(right[j])
+            j += 1
+
+    result.extend(left[i:])
+    result.extend(right[j:])
+    return result
 
 
 if __name__ == '__main__':
     import os
     import matplotlib.pyplot as plt
     import time
+    from UserLoader import load_users
     
     # Load users from file
     script_dir = os.path.dirname(os.path.abspath(__file__))
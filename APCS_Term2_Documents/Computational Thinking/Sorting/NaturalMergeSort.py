@@ -0,0 +1,445 @@
+MIN_MERGE = 32
+MIN_GALLOP = 7
+
+
+def compute_minrun(n):
+    # Same rule as Timsort: n / minrun is a power of two or slightly less
+    r = 0
+    while n >= MIN_MERGE:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+
+def gallop_right(key, run, start, end):
+    # Number of elements in run[start:end] with element key <= key (upper bound),
+    # found by exponential search followed by binary search.
+    # Returns (count, comparisons made)
+    n = end
+    if start >= n:
+        return 0, 0
+    comparisons = 1
+    if key < run[start][0]:
+        return 0, comparisons
+    lo, step = 0, 1
+    while start + step < n:
+        comparisons += 1
+        if key < run[start + step][0]:
+            break
+        lo = step
+        step = step * 2 + 1
+    hi = min(step, n - start)
+    # run[start + lo] <= key < run[start + hi] (or hi is the end)
+    lo += 1
+    while lo < hi:
+        mid = (lo + hi) // 2
+        comparisons += 1
+        if key < run[start + mid][0]:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo, comparisons
+
+
+def gallop_left(key, run, start, end):
+    # Number of elements in run[start:end] with element key < key (lower bound)
+    n = end
+    if start >= n:
+        return 0, 0
+    comparisons = 1
+    if run[start][0] >= key:
+        return 0, comparisons
+    lo, step = 0, 1
+    while start + step < n:
+        comparisons += 1
+        if run[start + step][0] >= key:
+            break
+        lo = step
+        step = step * 2 + 1
+    hi = min(step, n - start)
+    lo += 1
+    while lo < hi:
+        mid = (lo + hi) // 2
+        comparisons += 1
+        if run[start + mid][0] >= key:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo, comparisons
+
+
+def count_run(a, lo, hi, ctx):
+    # Length of the run starting at lo; strictly descending runs are reversed
+    # in place (strict, so equal keys never change order)
+    run_hi = lo + 1
+    if run_hi == hi:
+        return 1
+    comparisons = 1
+    if a[run_hi][0] < a[lo][0]:
+        while run_hi + 1 < hi:
+            comparisons += 1
+            if not a[run_hi + 1][0] < a[run_hi][0]:
+                break
+            run_hi += 1
+        a[lo:run_hi + 1] = a[lo:run_hi + 1][::-1]
+        ctx['writes'] += run_hi + 1 - lo
+    else:
+        while run_hi + 1 < hi:
+            comparisons += 1
+            if a[run_hi + 1][0] < a[run_hi][0]:
+                break
+            run_hi += 1
+    ctx['comparisons'] += comparisons
+    return run_hi + 1 - lo
+
+
+def binary_insertion_sort(a, lo, hi, start, ctx):
+    # Extend a short run a[lo:start] to a[lo:hi]
+    comparisons = writes = 0
+    for i in range(start, hi):
+        item = a[i]
+        left, right = lo, i
+        while left < right:
+            mid = (left + right) // 2
+            comparisons += 1
+            if item[0] < a[mid][0]:
+                right = mid
+            else:
+                left = mid + 1
+        if left < i:
+            a[left + 1:i + 1] = a[left:i]
+            a[left] = item
+            writes += i - left + 1
+    ctx['comparisons'] += comparisons
+    ctx['writes'] += writes
+
+
+def merge_at(a, runs, k, ctx):
+    lo, len_a = runs[k]
+    mid, len_b = runs[k + 1]
+    hi = mid + len_b
+    runs[k] = (lo, len_a + len_b)
+    del runs[k + 1]
+
+    # Elements of the left run already <= the first right element stay in place
+    skip, comparisons = gallop_right(a[mid][0], a, lo, mid)
+    lo += skip
+    if lo == mid:
+        ctx['comparisons'] += comparisons
+        return
+    # Elements of the right run already >= the last left element stay in place
+    keep, c = gallop_left(a[mid - 1][0], a, mid, hi)
+    comparisons += c
+    hi = mid + keep
+
+    left = a[lo:mid]
+    right = a[mid:hi]
+    # Merge buffers live next to the decorated copy a
+    ctx['max_memory'] = max(ctx['max_memory'], len(a) + len(left) + len(right))
+
+    out = lo
+    i = j = 0
+    writes = 0
+    n_left, n_right = len(left), len(right)
+    min_gallop = ctx['min_gallop']
+    while i < n_left and j < n_right:
+        # One-at-a-time mode until one side wins min_gallop times in a row
+        wins_left = wins_right = 0
+        while i < n_left and j < n_right:
+            comparisons += 1
+            if right[j][0] < left[i][0]:
+                a[out] = right[j]
+                j += 1
+                wins_right += 1
+                wins_left = 0
+            else:
+                a[out] = left[i]
+                i += 1
+                wins_left += 1
+                wins_right = 0
+            out += 1
+            writes += 1
+            if wins_left >= min_gallop or wins_right >= min_gallop:
+                break
+
+        # Galloping mode: copy whole stretches found by exponential search
+        while i < n_left and j < n_right:
+            count_left, c = gallop_right(right[j][0], left, i, n_left)
+            comparisons += c
+            a[out:out + count_left] = left[i:i + count_left]
+            out += count_left
+            i += count_left
+            writes += count_left
+            if i == n_left:
+                break
+
+            count_right, c = gallop_left(left[i][0], right, j, n_right)
+            comparisons += c
+            a[out:out + count_right] = right[j:j + count_right]
+            out += count_right
+            j += count_right
+            writes += count_right
+            if j == n_right:
+                break
+
+            if count_left < MIN_GALLOP and count_right < MIN_GALLOP:
+                # Galloping stopped paying off, make it harder to re-enter
+                min_gallop += 1
+                break
+            min_gallop = max(1, min_gallop - 1)
+
+    # Copy remaining elements
+    rest = left[i:] + right[j:]
+    a[out:out + len(rest)] = rest
+    writes += len(rest)
+
+    # Write local counters back once per merge
+    ctx['comparisons'] += comparisons
+    ctx['writes'] += writes
+    ctx['min_gallop'] = min_gallop
+
+
+def merge_collapse(a, runs, merge, ctx):
+    # Keep the run stack invariants: A > B + C and B > C for the top three runs
+    while len(runs) > 1:
+        n = len(runs) - 2
+        if ((n > 0 and runs[n - 1][1] <= runs[n][1] + runs[n + 1][1]) or
+                (n > 1 and runs[n - 2][1] <= runs[n - 1][1] + runs[n][1])):
+            if runs[n - 1][1] < runs[n + 1][1]:
+                n -= 1
+        elif runs[n][1] > runs[n + 1][1]:
+            break
+        merge(a, runs, n, ctx)
+
+
+def merge_force_collapse(a, runs, merge, ctx):
+    # Merge whatever is left on the run stack
+    while len(runs) > 1:
+        n = len(runs) - 2
+        if n > 0 and runs[n - 1][1] < runs[n + 1][1]:
+            n -= 1
+        merge(a, runs, n, ctx)
+
+
+def natural_merge_sort(arr, stats=None):
+    # Choose the code path once: counting only when stats are requested
+    if stats is None:
+        return natural_merge_sort_fast(arr)
+
+    ctx = {'comparisons': 0, 'writes': 0, 'max_memory': 0, 'max_depth': 0,
+           'min_gallop': MIN_GALLOP}
+
+    # Build each (age, first_name, last_name) key once
+    a = [((u['age'], u['first_name'], u['last_name']), u) for u in arr]
+    n = len(a)
+    # The decorated copy a and the result list are n elements each
+    ctx['max_memory'] = 2 * n
+    runs = []
+
+    lo = 0
+    minrun = compute_minrun(n)
+    while lo < n:
+        run_len = count_run(a, lo, n, ctx)
+        # Extend short natural runs to minrun with binary insertion sort
+        if run_len < minrun:
+            forced = min(minrun, n - lo)
+            binary_insertion_sort(a, lo, lo + forced, lo + run_len, ctx)
+            run_len = forced
+        runs.append((lo, run_len))
+        ctx['max_depth'] = max(ctx['max_depth'], len(runs))
+        merge_collapse(a, runs, merge_at, ctx)
+        lo += run_len
+
+    merge_force_collapse(a, runs, merge_at, ctx)
+
+    stats['comparisons'] += ctx['comparisons']
+    stats['writes'] += ctx['writes']
+    stats['max_memory'] = max(stats['max_memory'], ctx['max_memory'])
+    # Deepest run stack, natural merge sort has no recursion
+    stats['max_depth'] = max(stats['max_depth'], ctx['max_depth'])
+
+    return [u for _, u in a]
+
+
+# Uninstrumented path: the same runs, gallops and merges as above, no counters
+
+def gallop_right_fast(key, run, start, end):
+    n = end
+    if start >= n or key < run[start][0]:
+        return 0
+    lo, step = 0, 1
+    while start + step < n:
+        if key < run[start + step][0]:
+            break
+        lo = step
+        step = step * 2 + 1
+    hi = min(step, n - start)
+    lo += 1
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if key < run[start + mid][0]:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
+def gallop_left_fast(key, run, start, end):
+    n = end
+    if start >= n or run[start][0] >= key:
+        return 0
+    lo, step = 0, 1
+    while start + step < n:
+        if run[start + step][0] >= key:
+            break
+        lo = step
+        step = step * 2 + 1
+    hi = min(step, n - start)
+    lo += 1
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if run[start + mid][0] >= key:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
+def count_run_fast(a, lo, hi):
+    run_hi = lo + 1
+    if run_hi == hi:
+        return 1
+    if a[run_hi][0] < a[lo][0]:
+        while run_hi + 1 < hi and a[run_hi + 1][0] < a[run_hi][0]:
+            run_hi += 1
+        a[lo:run_hi + 1] = a[lo:run_hi + 1][::-1]
+    else:
+        while run_hi + 1 < hi and not a[run_hi + 1][0] < a[run_hi][0]:
+            run_hi += 1
+    return run_hi + 1 - lo
+
+
+def binary_insertion_sort_fast(a, lo, hi, start):
+    for i in range(start, hi):
+        item = a[i]
+        left, right = lo, i
+        while left < right:
+            mid = (left + right) // 2
+            if item[0] < a[mid][0]:
+                right = mid
+            else:
+                left = mid + 1
+        if left < i:
+            a[left + 1:i + 1] = a[left:i]
+            a[left] = item
+
+
+def merge_at_fast(a, runs, k, state):
+    lo, len_a = runs[k]
+    mid, len_b = runs[k + 1]
+    hi = mid + len_b
+    runs[k] = (lo, len_a + len_b)
+    del runs[k + 1]
+
+    lo += gallop_right_fast(a[mid][0], a, lo, mid)
+    if lo == mid:
+        return
+    hi = mid + gallop_left_fast(a[mid - 1][0], a, mid, hi)
+
+    left = a[lo:mid]
+    right = a[mid:hi]
+
+    out = lo
+    i = j = 0
+    n_left, n_right = len(left), len(right)
+    min_gallop = state['min_gallop']
+    while i < n_left and j < n_right:
+        wins_left = wins_right = 0
+        while i < n_left and j < n_right:
+            if right[j][0] < left[i][0]:
+                a[out] = right[j]
+                j += 1
+                wins_right += 1
+                wins_left = 0
+            else:
+                a[out] = left[i]
+                i += 1
+                wins_left += 1
+                wins_right = 0
+            out += 1
+            if wins_left >= min_gallop or wins_right >= min_gallop:
+                break
+
+        while i < n_left and j < n_right:
+            count_left = gallop_right_fast(right[j][0], left, i, n_left)
+            a[out:out + count_left] = left[i:i + count_left]
+            out += count_left
+            i += count_left
+            if i == n_left:
+                break
+
+            count_right = gallop_left_fast(left[i][0], right, j, n_right)
+            a[out:out + count_right] = right[j:j + count_right]
+            out += count_right
+            j += count_right
+            if j == n_right:
+                break
+
+            if count_left < MIN_GALLOP and count_right < MIN_GALLOP:
+                min_gallop += 1
+                break
+            min_gallop = max(1, min_gallop - 1)
+
+    rest = left[i:] + right[j:]
+    a[out:out + len(rest)] = rest
+    state['min_gallop'] = min_gallop
+
+
+def natural_merge_sort_fast(arr):
+    state = {'min_gallop': MIN_GALLOP}
+    a = [((u['age'], u['first_name'], u['last_name']), u) for u in arr]
+    n = len(a)
+    runs = []
+
+    lo = 0
+    minrun = compute_minrun(n)
+    while lo < n:
+        run_len = count_run_fast(a, lo, n)
+        if run_len < minrun:
+            forced = min(minrun, n - lo)
+            binary_insertion_sort_fast(a, lo, lo + forced, lo + run_len)
+            run_len = forced
+        runs.append((lo, run_len))
+        merge_collapse(a, runs, merge_at_fast, state)
+        lo += run_len
+
+    merge_force_collapse(a, runs, merge_at_fast, state)
+    return [u for _, u in a]
+
+
+if __name__ == '__main__':
+    import os
+    import time
+    from UserLoader import load_users
+
+    # Load users from file
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    users_file = os.path.join(script_dir, 'users.txt')
+    output_file = os.path.join(script_dir, 'output_natural.txt')
+    users = load_users(users_file)
+
+    # Sort users and measure time
+    start_time = time.time()
+    sorted_users = natural_merge_sort(users)
+    sort_time = time.time() - start_time
+
+    # Write to output file
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(f"Sorted by Age → First Name → Last Name:\n")
+        for user in sorted_users:
+            f.write(f"  Age: {user['age']:3}, First Name: {user['first_name']:10}, Last Name: {user['last_name']:10}\n")
+
+        f.write(f"\nSort completed in {sort_time:.6f} seconds\n")
+
+    print(f"Output written to output_natural.txt")
+    print(f"Sorted {len(users)} users in {sort_time:.6f} seconds")
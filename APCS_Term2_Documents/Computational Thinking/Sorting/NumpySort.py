@@ -0,0 +1,56 @@
+import numpy as np
+
+
+def users_to_arrays(arr):
+    # Age as an integer array, names as category codes of a sorted dictionary
+    ages = np.fromiter((u['age'] for u in arr), dtype=np.int64, count=len(arr))
+    first_names = np.array([u['first_name'] for u in arr])
+    last_names = np.array([u['last_name'] for u in arr])
+    _, first_codes = np.unique(first_names, return_inverse=True)
+    _, last_codes = np.unique(last_names, return_inverse=True)
+    return ages, first_codes, last_codes
+
+
+def lexsort_permutation(ages, first_codes, last_codes):
+    # np.lexsort sorts by the last key first: age → first_name → last_name
+    return np.lexsort((last_codes, first_codes, ages))
+
+
+def numpy_sort(arr, return_permutation=False):
+    if len(arr) == 0:
+        return np.empty(0, dtype=np.intp) if return_permutation else []
+
+    ages, first_codes, last_codes = users_to_arrays(arr)
+    order = lexsort_permutation(ages, first_codes, last_codes)
+
+    if return_permutation:
+        return order
+    return [arr[i] for i in order.tolist()]
+
+
+if __name__ == '__main__':
+    import os
+    import time
+    from UserLoader import load_users
+
+    # Load users from file
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    users_file = os.path.join(script_dir, 'users.txt')
+    output_file = os.path.join(script_dir, 'output_numpy.txt')
+    users = load_users(users_file)
+
+    # Sort users and measure time
+    start_time = time.time()
+    sorted_users = numpy_sort(users)
+    sort_time = time.time() - start_time
+
+    # Write to output file
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(f"Sorted by Age → First Name → Last Name:\n")
+        for user in sorted_users:
+            f.write(f"  Age: {user['age']:3}, First Name: {user['first_name']:10}, Last Name: {user['last_name']:10}\n")
+
+        f.write(f"\nSort completed in {sort_time:.6f} seconds\n")
+
+    print(f"Output written to output_numpy.txt")
+    print(f"Sorted {len(users)} users in {sort_time:.6f} seconds")
@@ -0,0 +1,100 @@
+from bisect import bisect_right
+
+
+class SortedBlocks:
+    # Sorted list kept as short sorted blocks: an insert is a binary search over
+    # the block maxima plus a binary search and list insert inside one block
+    def __init__(self, load=256):
+        self.load = load
+        self.blocks = []   # users, sorted within and across blocks
+        self.keys = []     # matching (age, first_name, last_name) keys
+        self.maxes = []    # last key of every block
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def insert(self, user):
+        key = (user['age'], user['first_name'], user['last_name'])
+        self.size += 1
+
+        if not self.blocks:
+            self.blocks.append([user])
+            self.keys.append([key])
+            self.maxes.append(key)
+            return
+
+        # bisect_right places a new user after equal keys, so file order is kept (stable)
+        b = bisect_right(self.maxes, key)
+        if b == len(self.blocks):
+            b -= 1
+        block_keys = self.keys[b]
+        pos = bisect_right(block_keys, key)
+        block_keys.insert(pos, key)
+        self.blocks[b].insert(pos, user)
+        self.maxes[b] = block_keys[-1]
+
+        # Split blocks that grew too large to keep inserts cheap
+        if len(block_keys) > 2 * self.load:
+            self.blocks[b:b + 1] = [self.blocks[b][:self.load], self.blocks[b][self.load:]]
+            self.keys[b:b + 1] = [block_keys[:self.load], block_keys[self.load:]]
+            self.maxes[b:b + 1] = [self.keys[b][-1], self.keys[b + 1][-1]]
+
+    def snapshot(self):
+        result = []
+        for block in self.blocks:
+            result.extend(block)
+        return result
+
+
+def sorted_prefixes(users, sizes):
+    # Insert users in file order and snapshot each requested prefix on the way,
+    # one O(n log n) pass instead of one full sort per prefix size
+    wanted = sorted(set(sizes))
+    engine = SortedBlocks()
+    prefixes = {}
+    inserted = 0
+
+    for size in wanted:
+        for user in users[inserted:size]:
+            engine.insert(user)
+        inserted = size
+        prefixes[size] = engine.snapshot()
+
+    return prefixes
+
+
+def format_users(users):
+    # All lines of the sorted data section as one string, written with a single f.write
+    return ''.join([f"  Age: {user['age']:3}, First Name: {user['first_name']:10}, Last Name: {user['last_name']:10}\n"
+                    for user in users])
+
+
+if __name__ == '__main__':
+    import os
+    import time
+    from MergeSort import merge_sort
+    from UserLoader import load_users
+
+    # Load users from file
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    users_file = os.path.join(script_dir, 'users.txt')
+    users = load_users(users_file)
+    test_sizes = [5, 10, 25, 50, 100, 250, 500, 750, 1000, 1500, 2000, 3000, 4000, 5000]
+
+    # Sort every prefix in one pass and measure time
+    start_time = time.time()
+    prefixes = sorted_prefixes(users, test_sizes)
+    prefix_time = time.time() - start_time
+
+    # Previous approach: one full merge sort per prefix size
+    start_time = time.time()
+    expected = {size: merge_sort(users[:size]) for size in test_sizes}
+    merge_time = time.time() - start_time
+
+    if prefixes != expected:
+        raise AssertionError("Prefix engine output differs from Merge Sort")
+
+    print(f"Sorted {len(prefixes)} prefixes of {len(users)} users")
+    print(f"  One pass (sorted blocks): {prefix_time:.6f} seconds")
+    print(f"  Merge sort per prefix:    {merge_time:.6f} seconds")
@@ -0,0 +1,73 @@
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from SortService import DEFAULT_SOCKET, DEFAULT_PORT, SortClient
+
+
+def wait_for_service(socket_path, port, timeout=30.0):
+    deadline = time.perf_counter() + timeout
+    while True:
+        try:
+            return SortClient(socket_path, port)
+        except OSError:
+            if time.perf_counter() > deadline:
+                raise
+            time.sleep(0.05)
+
+
+def summarize(name, times):
+    times = sorted(times)
+    p95 = times[min(len(times) - 1, int(len(times) * 0.95))]
+    total = sum(times)
+    throughput = len(times) / total if total > 0 else float('inf')
+    print(f"{name:<40} {statistics.median(times) * 1000:<15.3f} {p95 * 1000:<15.3f} {throughput:<15.1f}")
+
+
+def time_requests(func, args_list):
+    times = []
+    for args in args_list:
+        start = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+if __name__ == '__main__':
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    script_runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    requests = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    port = None if hasattr(__import__('socket'), 'AF_UNIX') else DEFAULT_PORT
+
+    print(f"{'Request':<40} {'Median (ms)':<15} {'p95 (ms)':<15} {'Req/s':<15}")
+    print("-" * 85)
+
+    # Current approach: a fresh interpreter per sort (startup, imports, load_users, sort)
+    script_times = time_requests(
+        lambda: subprocess.run([sys.executable, os.path.join(script_dir, 'MergeSort.py')],
+                               cwd=script_dir, capture_output=True, check=True),
+        [()] * script_runs)
+    summarize('python MergeSort.py', script_times)
+
+    server_args = [sys.executable, os.path.join(script_dir, 'SortService.py')]
+    if port is not None:
+        server_args += ['--port', str(port)]
+    server = subprocess.Popen(server_args, cwd=script_dir, stdout=subprocess.DEVNULL)
+    try:
+        with wait_for_service(DEFAULT_SOCKET, port) as client:
+            summarize('service: full sorted order (cached)',
+                      time_requests(client.sorted_slice, [()] * requests))
+            summarize('service: slice [0:100] (cached)',
+                      time_requests(client.sorted_slice, [(0, 100)] * requests))
+            # Distinct prefix sizes miss the cache every time
+            summarize('service: prefix sort (uncached)',
+                      time_requests(client.prefix_sort, [(size,) for size in range(1, requests + 1)]))
+            summarize('service: prefix sort 5000 (cached)',
+                      time_requests(client.prefix_sort, [(5000,)] * requests))
+            summarize('service: reload', time_requests(client.reload, [()] * 5))
+            print(f"\nService cache: {client.stats()}")
+    finally:
+        server.terminate()
+        server.wait()
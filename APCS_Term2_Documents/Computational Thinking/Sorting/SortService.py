@@ -0,0 +1,227 @@
+import asyncio
+import json
+import os
+import signal
+import socket
+import tempfile
+import time
+from collections import OrderedDict
+
+from MergeSort import merge_sort
+from UserLoader import load_users
+
+# AF_UNIX paths are limited to about 108 bytes, a deep checkout directory can exceed that
+DEFAULT_SOCKET = os.path.join(tempfile.gettempdir(), 'sort_service.sock')
+DEFAULT_PORT = 8765
+CACHE_SIZE = 128
+# Longest request line accepted; longer lines are skipped and answered with an error
+MAX_REQUEST = 1 << 16
+
+
+def error_line(message):
+    return (json.dumps({'ok': False, 'error': message}) + '\n').encode('utf-8')
+
+
+async def read_request(reader):
+    # One request line, b'' at end of stream, None for a line over MAX_REQUEST
+    try:
+        return await reader.readuntil(b'\n')
+    except asyncio.IncompleteReadError as e:
+        # Last line without a newline
+        return e.partial
+    except asyncio.LimitOverrunError as e:
+        consumed = e.consumed
+    # Drop the oversized line up to and including its newline
+    while True:
+        try:
+            await reader.readexactly(consumed)
+            await reader.readuntil(b'\n')
+            return None
+        except asyncio.IncompleteReadError:
+            return None
+        except asyncio.LimitOverrunError as e:
+            consumed = e.consumed
+
+
+class SortService:
+    # Keeps users.txt loaded and sorted once; answers requests from that order
+    def __init__(self, users_file, cache_size=CACHE_SIZE):
+        self.users_file = users_file
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.reload()
+
+    def reload(self):
+        start = time.perf_counter()
+        self.users = load_users(self.users_file)
+        # Remember each user's position in the file so prefix sorts can be
+        # answered by filtering the full sorted order (a stable sort keeps ties in file order)
+        positioned = [dict(u, position=i) for i, u in enumerate(self.users)]
+        self.sorted_users = merge_sort(positioned)
+        self.cache.clear()
+        self.load_time = time.perf_counter() - start
+
+    @staticmethod
+    def plain(users):
+        return [{'age': u['age'], 'first_name': u['first_name'], 'last_name': u['last_name']}
+                for u in users]
+
+    def sorted_slice(self, start, stop):
+        return self.plain(self.sorted_users[start:stop])
+
+    def prefix_sort(self, size):
+        # Sorted order of the first `size` users of the file, in O(n) without re-sorting
+        return self.plain([u for u in self.sorted_users if u['position'] < size])
+
+    def handle(self, request):
+        op = request.get('op')
+        if op == 'reload':
+            self.reload()
+            return {'ok': True, 'count': len(self.users), 'load_time': self.load_time}
+        if op == 'stats':
+            return {'ok': True, 'count': len(self.users), 'load_time': self.load_time,
+                    'cache_entries': len(self.cache), 'hits': self.hits, 'misses': self.misses}
+        if op == 'slice':
+            return {'ok': True, 'users': self.sorted_slice(request.get('start'), request.get('stop'))}
+        if op == 'prefix':
+            return {'ok': True, 'users': self.prefix_sort(int(request['size']))}
+        return {'ok': False, 'error': f"unknown op: {op}"}
+
+    def respond(self, line):
+        # Encoded responses of recent read requests are kept in an LRU cache
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            return error_line(f"bad request: {e}")
+        if not isinstance(request, dict):
+            return error_line("bad request: expected a JSON object")
+
+        cacheable = request.get('op') in ('slice', 'prefix')
+        key = line.strip()
+        if cacheable and key in self.cache:
+            self.cache.move_to_end(key)
+            self.hits += 1
+            return self.cache[key]
+
+        try:
+            response = self.handle(request)
+        except (KeyError, TypeError, ValueError) as e:
+            response = {'ok': False, 'error': f"bad request: {e}"}
+        except OSError as e:
+            # users.txt missing or unreadable on reload: keep serving the old order
+            response = {'ok': False, 'error': f"reload failed: {e}"}
+        except Exception as e:
+            # One bad request must not close the connection or stop the service
+            response = {'ok': False, 'error': f"internal error: {type(e).__name__}: {e}"}
+        data = (json.dumps(response) + '\n').encode('utf-8')
+
+        if cacheable and response['ok']:
+            self.misses += 1
+            self.cache[key] = data
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return data
+
+    async def serve_client(self, reader, writer):
+        # One JSON request per line, one JSON response per line
+        try:
+            while True:
+                line = await read_request(reader)
+                if line is None:
+                    writer.write(error_line(f"bad request: longer than {MAX_REQUEST} bytes"))
+                elif not line:
+                    break
+                else:
+                    writer.write(self.respond(line))
+                await writer.drain()
+        finally:
+            writer.close()
+
+
+async def serve(users_file, socket_path=DEFAULT_SOCKET, port=None):
+    service = SortService(users_file)
+    print(f"Loaded and sorted {len(service.users)} users in {service.load_time:.6f} seconds")
+
+    if port is None and hasattr(socket, 'AF_UNIX'):
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        server = await asyncio.start_unix_server(service.serve_client, path=socket_path,
+                                                  limit=MAX_REQUEST)
+        print(f"Listening on {socket_path}")
+    else:
+        # No Unix domain sockets (Windows): fall back to localhost TCP
+        server = await asyncio.start_server(service.serve_client, '127.0.0.1', port or DEFAULT_PORT,
+                                            limit=MAX_REQUEST)
+        print(f"Listening on 127.0.0.1:{port or DEFAULT_PORT}")
+
+    # Stop cleanly on SIGTERM; Windows has no loop signal handlers, stop with Ctrl+C there
+    stop = asyncio.Event()
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, stop.set)
+    except NotImplementedError:
+        pass
+
+    async with server:
+        await stop.wait()
+
+
+class SortClient:
+    # Blocking client for SortService, one connection reused for all requests
+    def __init__(self, socket_path=DEFAULT_SOCKET, port=None):
+        if port is None and hasattr(socket, 'AF_UNIX'):
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.sock.connect(socket_path)
+        else:
+            self.sock = socket.create_connection(('127.0.0.1', port or DEFAULT_PORT))
+        self.stream = self.sock.makefile('rwb')
+
+    def close(self):
+        self.stream.close()
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def request(self, **request):
+        self.stream.write((json.dumps(request) + '\n').encode('utf-8'))
+        self.stream.flush()
+        response = json.loads(self.stream.readline())
+        if not response['ok']:
+            raise RuntimeError(response['error'])
+        return response
+
+    def sorted_slice(self, start=None, stop=None):
+        return self.request(op='slice', start=start, stop=stop)['users']
+
+    def prefix_sort(self, size):
+        return self.request(op='prefix', size=size)['users']
+
+    def reload(self):
+        return self.request(op='reload')
+
+    def stats(self):
+        return self.request(op='stats')
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Resident sort service for users.txt')
+    parser.add_argument('--socket', default=DEFAULT_SOCKET, help='Unix domain socket path')
+    parser.add_argument('--port', type=int, default=None, help='use localhost TCP on this port instead')
+    args = parser.parse_args()
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    users_file = os.path.join(script_dir, 'users.txt')
+    try:
+        asyncio.run(serve(users_file, args.socket, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if args.port is None and os.path.exists(args.socket):
+            os.remove(args.socket)
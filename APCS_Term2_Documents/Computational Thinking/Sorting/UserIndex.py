@@ -0,0 +1,339 @@
+import heapq
+import mmap
+import os
+import struct
+
+# File layout: header, then main_count records sorted by age → first_name → last_name,
+# then pending_count unsorted records added by insert() since the last compaction
+HEADER = struct.Struct('<8sHHHxxQQQq')
+MAGIC = b'USERIDX1'
+VERSION = 3
+INDEX_SUFFIX = '.idx'
+
+# Ages are stored as int64 like in the users cache
+MIN_AGE = -2 ** 63
+MAX_AGE = 2 ** 63 - 1
+
+# Fold pending records into the sorted main part once there are this many
+MIN_PENDING = 64
+
+
+def record_struct(first_width, last_width):
+    # age, first_name and last_name as NUL-padded UTF-8, byte offset of the line in users.txt
+    return struct.Struct(f'<q{first_width}s{last_width}sq')
+
+
+def scan_user_lines(data):
+    # Same rule as load_users (lines end at \n, \r\n or \r, exactly three
+    # str.split() fields per line), plus each line's byte offset
+    offset = 3 if data.startswith(b'\xef\xbb\xbf') else 0
+    records = []
+    for line in data[offset:].splitlines(keepends=True):
+        parts = line.decode('utf-8').split()
+        if len(parts) == 3:
+            age = int(parts[0])
+            # Ages beyond int64 do not fit a record, those lines are left out of the index
+            if MIN_AGE <= age <= MAX_AGE:
+                records.append((age, parts[1].encode('utf-8'), parts[2].encode('utf-8'), offset))
+        offset += len(line)
+    return records
+
+
+def record_key(record):
+    # UTF-8 byte order equals str order, so keys match the other sorts
+    return record[0], record[1], record[2]
+
+
+def write_index(index_file, records, source_size, source_mtime_ns):
+    first_width = max([len(r[1]) for r in records] + [1])
+    last_width = max([len(r[2]) for r in records] + [1])
+    rec = record_struct(first_width, last_width)
+
+    buf = bytearray(HEADER.size + rec.size * len(records))
+    HEADER.pack_into(buf, 0, MAGIC, VERSION, first_width, last_width, len(records), 0,
+                     source_size, source_mtime_ns)
+    pos = HEADER.size
+    for record in records:
+        rec.pack_into(buf, pos, *record)
+        pos += rec.size
+
+    # Write to a temporary file first so a crash never leaves a broken index
+    tmp_file = index_file + '.tmp'
+    with open(tmp_file, 'wb') as f:
+        f.write(buf)
+    os.replace(tmp_file, index_file)
+
+
+def build_index(users_file, index_file):
+    with open(users_file, 'rb') as f:
+        data = f.read()
+        source_mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+    records = sorted(scan_user_lines(data), key=record_key)
+    write_index(index_file, records, len(data), source_mtime_ns)
+
+
+def check_age(age):
+    # Checked before users.txt is touched, a record that cannot be packed must never reach the file
+    if not isinstance(age, int) or isinstance(age, bool) or not MIN_AGE <= age <= MAX_AGE:
+        raise ValueError(f"Invalid age: {age!r}")
+
+
+def check_name(name):
+    # Names are stored as single whitespace-separated fields in users.txt
+    # and NUL-padded in the index, so neither may appear inside a name
+    if not name or '\0' in name or any(c.isspace() for c in name):
+        raise ValueError(f"Invalid name: {name!r}")
+
+
+class UserIndex:
+    def __init__(self, index_file, users_file):
+        self.index_file = index_file
+        self.users_file = users_file
+        self.open()
+        self.refresh()
+
+    @classmethod
+    def build(cls, users_file, index_file=None):
+        if index_file is None:
+            index_file = users_file + INDEX_SUFFIX
+        build_index(users_file, index_file)
+        return cls(index_file, users_file)
+
+    def open(self):
+        self.file = open(self.index_file, 'r+b')
+        header = self.file.read(HEADER.size)
+        if len(header) != HEADER.size:
+            self.file.close()
+            raise ValueError(f"{self.index_file} is not a user index")
+        magic, version, self.first_width, self.last_width, self.main_count, pending_count, \
+            self.source_size, self.source_mtime_ns = HEADER.unpack(header)
+        if magic != MAGIC or version != VERSION:
+            self.file.close()
+            raise ValueError(f"{self.index_file} is not a user index")
+        self.rec = record_struct(self.first_width, self.last_width)
+
+        # Map only the sorted part; pending records are few and kept in memory
+        main_size = HEADER.size + self.rec.size * self.main_count
+        self.mm = mmap.mmap(self.file.fileno(), main_size, access=mmap.ACCESS_READ)
+
+        self.file.seek(main_size)
+        pending_data = self.file.read(self.rec.size * pending_count)
+        self.pending = sorted((self.strip(r) for r in self.rec.iter_unpack(pending_data)),
+                              key=record_key)
+
+    def close(self):
+        self.mm.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.main_count + len(self.pending)
+
+    def is_current(self):
+        # False when users.txt was changed by something other than insert()
+        st = os.stat(self.users_file)
+        return st.st_size == self.source_size and st.st_mtime_ns == self.source_mtime_ns
+
+    def refresh(self):
+        # Rebuild a stale index from users.txt so queries never use old offsets
+        if not self.is_current():
+            self.close()
+            build_index(self.users_file, self.index_file)
+            self.open()
+
+    @staticmethod
+    def strip(record):
+        age, first, last, offset = record
+        return age, first.rstrip(b'\0'), last.rstrip(b'\0'), offset
+
+    def record(self, i):
+        return self.strip(self.rec.unpack_from(self.mm, HEADER.size + i * self.rec.size))
+
+    def age_at(self, i):
+        return struct.unpack_from('<q', self.mm, HEADER.size + i * self.rec.size)[0]
+
+    def lower_bound(self, key, lo=0, hi=None):
+        # First main record whose key is >= key; key may be (age,) or (age, first_name)
+        if hi is None:
+            hi = self.main_count
+        n = len(key)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.record(mid)[:n] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def age_bound(self, age, lo=0, hi=None):
+        # First main record with record age >= age, reading only the age field
+        if hi is None:
+            hi = self.main_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.age_at(mid) < age:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def merged(self, main_records, pending_records, limit=None):
+        # Main records win ties, they were inserted before any pending record
+        records = heapq.merge(main_records, pending_records, key=record_key)
+        result = []
+        for record in records:
+            if limit is not None and len(result) >= limit:
+                break
+            result.append(record)
+        return result
+
+    @staticmethod
+    def to_user(record, with_offset=False):
+        age, first, last, offset = record
+        user = {'age': age, 'first_name': first.decode('utf-8'), 'last_name': last.decode('utf-8')}
+        if with_offset:
+            user['offset'] = offset
+        return user
+
+    def range_by_age(self, min_age, max_age, with_offset=False):
+        # All users with min_age <= age <= max_age, in sorted order
+        self.refresh()
+        start = self.age_bound(min_age)
+        end = self.age_bound(max_age + 1, start)
+        main = (self.record(i) for i in range(start, end))
+        pending = (r for r in self.pending if min_age <= r[0] <= max_age)
+        return [self.to_user(r, with_offset) for r in self.merged(main, pending)]
+
+    def top_k(self, k, with_offset=False):
+        # First k users by age → first_name → last_name
+        self.refresh()
+        main = (self.record(i) for i in range(min(k, self.main_count)))
+        return [self.to_user(r, with_offset) for r in self.merged(main, self.pending, k)]
+
+    def first_name_prefix(self, prefix, with_offset=False):
+        # Names are only sorted inside one age, so binary search each age bucket
+        self.refresh()
+        prefix = prefix.encode('utf-8')
+        # 0xFF never occurs in UTF-8, so it sorts after every name with this prefix
+        prefix_end = prefix + b'\xff'
+        main = []
+        start = 0
+        while start < self.main_count:
+            age = self.age_at(start)
+            bucket_end = self.age_bound(age + 1, start)
+            lo = self.lower_bound((age, prefix), start, bucket_end)
+            hi = self.lower_bound((age, prefix_end), lo, bucket_end)
+            main.extend(self.record(i) for i in range(lo, hi))
+            start = bucket_end
+        pending = (r for r in self.pending if r[1].startswith(prefix))
+        return [self.to_user(r, with_offset) for r in self.merged(main, pending)]
+
+    def insert(self, age, first_name, last_name):
+        # Append the user to users.txt and to the unsorted tail of the index
+        check_age(age)
+        check_name(first_name)
+        check_name(last_name)
+        self.refresh()
+        first = first_name.encode('utf-8')
+        last = last_name.encode('utf-8')
+        with open(self.users_file, 'ab+') as f:
+            f.seek(0, os.SEEK_END)
+            offset = f.tell()
+            if offset > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    f.write(b'\n')
+                    offset += 1
+            line = f"{age} {first_name} {last_name}\n".encode('utf-8')
+            f.write(line)
+            f.flush()
+            st = os.fstat(f.fileno())
+        self.source_size = st.st_size
+        self.source_mtime_ns = st.st_mtime_ns
+
+        record = (age, first, last, offset)
+        self.pending.append(record)
+        self.pending.sort(key=record_key)
+
+        # Names wider than the fixed record width need a compaction anyway
+        if (len(first) > self.first_width or len(last) > self.last_width or
+                len(self.pending) >= max(MIN_PENDING, self.main_count // 16)):
+            self.compact()
+            return
+
+        self.file.seek(0, os.SEEK_END)
+        self.file.write(self.rec.pack(*record))
+        self.file.seek(0)
+        self.file.write(HEADER.pack(MAGIC, VERSION, self.first_width, self.last_width,
+                                    self.main_count, len(self.pending), self.source_size,
+                                    self.source_mtime_ns))
+        self.file.flush()
+
+    def compact(self):
+        # Linear merge of the sorted main part with the sorted pending records,
+        # no full re-sort of the users file
+        main = (self.record(i) for i in range(self.main_count))
+        records = self.merged(main, self.pending)
+        self.close()
+        write_index(self.index_file, records, self.source_size, self.source_mtime_ns)
+        self.open()
+
+
+if __name__ == '__main__':
+    import shutil
+    import tempfile
+    import time
+    from MergeSort import merge_sort
+    from UserLoader import load_users
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    users_file = os.path.join(script_dir, 'users.txt')
+
+    start = time.perf_counter()
+    index = UserIndex.build(users_file)
+    build_time = time.perf_counter() - start
+    print(f"Built index of {len(index)} users in {build_time:.6f} seconds")
+
+    with index:
+        start = time.perf_counter()
+        in_range = index.range_by_age(30, 40)
+        first_100 = index.top_k(100)
+        prefixed = index.first_name_prefix('Tr')
+        query_time = time.perf_counter() - start
+
+        # Previous approach: full merge sort, then filter
+        start = time.perf_counter()
+        sorted_users = merge_sort(load_users(users_file))
+        expected_range = [u for u in sorted_users if 30 <= u['age'] <= 40]
+        expected_prefix = [u for u in sorted_users if u['first_name'].startswith('Tr')]
+        sort_time = time.perf_counter() - start
+
+        if (in_range != expected_range or first_100 != sorted_users[:100] or
+                prefixed != expected_prefix):
+            raise AssertionError("Index queries differ from Merge Sort")
+
+        print(f"Aged 30-40: {len(in_range)} users, first names starting with 'Tr': {len(prefixed)} users")
+        print(f"  Index queries:       {query_time:.6f} seconds")
+        print(f"  Sort and filter:     {sort_time:.6f} seconds")
+
+    # Inserts, compaction and stale rebuilds, on a copy so users.txt stays untouched
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        copy_file = os.path.join(tmp_dir, 'users.txt')
+        shutil.copyfile(users_file, copy_file)
+        with UserIndex.build(copy_file) as index:
+            for i in range(MIN_PENDING + 10):
+                index.insert(18 + i % 50, f"Inserted{i}", 'Testuser')
+            if index.top_k(len(index)) != merge_sort(load_users(copy_file, False)):
+                raise AssertionError("Index differs from Merge Sort after inserts")
+
+            # users.txt changed behind the index's back: the next query rebuilds it
+            with open(copy_file, 'a', encoding='utf-8') as f:
+                f.write("17 Appended Outside\n")
+            if index.top_k(len(index) + 1) != merge_sort(load_users(copy_file, False)):
+                raise AssertionError("Index differs from Merge Sort after an outside change")
+        print(f"Inserted {MIN_PENDING + 10} users and rebuilt a stale index: matches Merge Sort")
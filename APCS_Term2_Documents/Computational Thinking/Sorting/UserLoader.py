@@ -0,0 +1,172 @@
+import gc
+import hashlib
+import os
+import struct
+from array import array
+
+CACHE_MAGIC = b'USRCACHE'
+CACHE_VERSION = 2
+CACHE_SUFFIX = '.cache.bin'
+
+# Data-only cache layout: header, ages as int64, then newline-joined first and last names
+CACHE_HEADER = struct.Struct('<8sH6xqqQ32sQQ')
+
+
+class gc_paused:
+    # Millions of small lists/dicts would otherwise trigger repeated full GC passes
+    def __enter__(self):
+        self.was_enabled = gc.isenabled()
+        gc.disable()
+
+    def __exit__(self, *exc):
+        if self.was_enabled:
+            gc.enable()
+
+
+def parse_users(text):
+    with gc_paused():
+        # Fast path: split the whole buffer once and take every third token.
+        # Only valid when every line is exactly "<age> <first> <last>" with single
+        # spaces, which rebuilding the text from the three columns confirms
+        tokens = text.split()
+        if len(tokens) % 3 == 0:
+            ages, first_names, last_names = tokens[0::3], tokens[1::3], tokens[2::3]
+            rebuilt = '\n'.join(map(' '.join, zip(ages, first_names, last_names)))
+            if text == rebuilt or text == rebuilt + '\n':
+                return list(map(int, ages)), first_names, last_names
+
+        # Any other layout (tabs, CRLF, blank or malformed lines): line by line,
+        # keeping only lines with exactly three fields. Lines end only at \n, \r\n
+        # or \r like in a text-mode file; splitlines() would also break at \x0c, \x85, ...
+        lines = text.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+        rows = [parts for parts in map(str.split, lines) if len(parts) == 3]
+        ages = list(map(int, [r[0] for r in rows]))
+        first_names = [r[1] for r in rows]
+        last_names = [r[2] for r in rows]
+    return ages, first_names, last_names
+
+
+def file_hash(data):
+    return hashlib.sha256(data).digest()
+
+
+def pack_cache(ages, first_names, last_names, mtime_ns, size, digest):
+    try:
+        age_bytes = array('q', ages).tobytes()
+    except OverflowError:
+        # Ages beyond 64 bits are valid input, they just are not cached
+        return None
+    # Names never contain whitespace, so newline-joined columns are unambiguous
+    first_bytes = '\n'.join(first_names).encode('utf-8')
+    last_bytes = '\n'.join(last_names).encode('utf-8')
+    header = CACHE_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, mtime_ns, size, len(ages), digest,
+                               len(first_bytes), len(last_bytes))
+    return header + age_bytes + first_bytes + last_bytes
+
+
+def read_cache(cache_file):
+    # Header fields plus the raw cache bytes, or None for a missing or invalid cache
+    try:
+        with open(cache_file, 'rb') as f:
+            data = f.read()
+        magic, version, mtime_ns, size, count, digest, first_len, last_len = \
+            CACHE_HEADER.unpack_from(data)
+    except (OSError, struct.error):
+        return None
+    if magic != CACHE_MAGIC or version != CACHE_VERSION:
+        return None
+    if len(data) != CACHE_HEADER.size + 8 * count + first_len + last_len:
+        return None
+    return {'mtime_ns': mtime_ns, 'size': size, 'count': count, 'sha256': digest,
+            'first_len': first_len, 'last_len': last_len, 'data': data}
+
+
+def unpack_cache(cache):
+    # Columns stored in the cache, or None if they cannot be decoded
+    try:
+        count = cache['count']
+        pos = CACHE_HEADER.size
+        ages = array('q')
+        ages.frombytes(cache['data'][pos:pos + 8 * count])
+        pos += 8 * count
+        first_blob = cache['data'][pos:pos + cache['first_len']].decode('utf-8')
+        pos += cache['first_len']
+        last_blob = cache['data'][pos:pos + cache['last_len']].decode('utf-8')
+        if count == 0:
+            return [], [], []
+        first_names = first_blob.split('\n')
+        last_names = last_blob.split('\n')
+        if len(first_names) != count or len(last_names) != count:
+            return None
+        return ages.tolist(), first_names, last_names
+    except (KeyError, ValueError):
+        return None
+
+
+def write_cache(cache_file, data):
+    # Write to a temporary file first so a crash never leaves a broken cache
+    tmp_file = cache_file + '.tmp'
+    try:
+        with open(tmp_file, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        # Cache is only an optimization, a read-only directory is fine
+        pass
+
+
+def load_user_columns(filename, use_cache=True):
+    cache_file = filename + CACHE_SUFFIX
+    st = os.stat(filename)
+
+    cache = read_cache(cache_file) if use_cache else None
+    # Fast path: source file untouched since the cache was written
+    if cache is not None and cache['mtime_ns'] == st.st_mtime_ns and cache['size'] == st.st_size:
+        columns = unpack_cache(cache)
+        if columns is not None:
+            return columns
+
+    # Read the file in one bulk read instead of line by line
+    with open(filename, 'rb') as f:
+        data = f.read()
+    digest = file_hash(data)
+
+    # Source was touched but not changed: refresh the stamp, keep the columns
+    if cache is not None and cache['sha256'] == digest:
+        columns = unpack_cache(cache)
+        if columns is not None:
+            write_cache(cache_file, CACHE_HEADER.pack(
+                CACHE_MAGIC, CACHE_VERSION, st.st_mtime_ns, st.st_size, cache['count'], digest,
+                cache['first_len'], cache['last_len']) + cache['data'][CACHE_HEADER.size:])
+            return columns
+
+    ages, first_names, last_names = parse_users(data.decode('utf-8-sig'))
+
+    if use_cache:
+        packed = pack_cache(ages, first_names, last_names, st.st_mtime_ns, st.st_size, digest)
+        if packed is not None:
+            write_cache(cache_file, packed)
+
+    return ages, first_names, last_names
+
+
+def load_users(filename, use_cache=True):
+    ages, first_names, last_names = load_user_columns(filename, use_cache)
+    with gc_paused():
+        return [{'age': age, 'first_name': first, 'last_name': last}
+                for age, first, last in zip(ages, first_names, last_names)]
+
+
+def load_users_linewise(filename):
+    # Original line-by-line loader, kept as the benchmark baseline
+    users = []
+    with open(filename, 'r', encoding='utf-8-sig') as f:
+        for line in f:
+            parts = line.strip().split()
+            if len(parts) == 3:
+                users.append({
+                    'age': int(parts[0]),
+                    'first_name': parts[1],
+                    'last_name': parts[2]
+                })
+    return users